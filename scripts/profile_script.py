@@ -1,43 +1,65 @@
 #!/usr/bin/env python3
 
 import cProfile
+import os
 import pstats
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 from pstats import SortKey
-from typing import cast
 
-from scipy.optimize import bisect, brenth, brentq, ridder, toms748
+import numpy as np
 
-from pycalceff.core.cli_utils import parse_efficiency_file
-from pycalceff.core.effic import HPDAlgorithm, RootFinder, effic
+from pycalceff.core.effic import (
+    DEFAULT_ROOT_FINDER_BISECT,
+    DEFAULT_ROOT_FINDER_BRENTH,
+    DEFAULT_ROOT_FINDER_BRENTQ,
+    DEFAULT_ROOT_FINDER_RIDDER,
+    DEFAULT_ROOT_FINDER_TOMS748,
+    HPDAlgorithm,
+    RootFinder,
+    effic,
+    effic_batch,
+)
 
 # Supported root finders
 SUPPORTED_ROOT_FINDERS: dict[str, RootFinder] = {
-    "bisect": cast(RootFinder, bisect),
-    "brenth": cast(RootFinder, brenth),
-    "brentq": cast(RootFinder, brentq),
-    "ridder": cast(RootFinder, ridder),
-    "toms748": cast(RootFinder, partial(toms748, k=1)),
+    "bisect": DEFAULT_ROOT_FINDER_BISECT,
+    "brenth": DEFAULT_ROOT_FINDER_BRENTH,
+    "brentq": DEFAULT_ROOT_FINDER_BRENTQ,
+    "ridder": DEFAULT_ROOT_FINDER_RIDDER,
+    "toms748": DEFAULT_ROOT_FINDER_TOMS748,
 }
 
 # Supported HPD algorithms
 SUPPORTED_ALGORITHMS: dict[str, HPDAlgorithm] = {
     "root_finding": HPDAlgorithm.ROOT_FINDING,
     "binary_search": HPDAlgorithm.BINARY_SEARCH,
+    "newton": HPDAlgorithm.NEWTON,
 }
 
+# Name of the pseudo-algorithm that processes all rows at once with
+# effic_batch (the vectorized BINARY_SEARCH algorithm)
+BATCH_ALGORITHM = "batch"
+
 
 def main() -> None:
-    if len(sys.argv) != 3:
+    if len(sys.argv) not in (3, 4):
         print(
-            "Usage: python profile_script.py <root_finder> <algorithm>",
+            "Usage: python profile_script.py <root_finder> <algorithm> [jobs]",
             file=sys.stderr,
         )
         supported_finders = ", ".join(SUPPORTED_ROOT_FINDERS.keys())
         print(f"Supported root finders: {supported_finders}", file=sys.stderr)
-        supported_algorithms = ", ".join(SUPPORTED_ALGORITHMS.keys())
+        supported_algorithms = ", ".join(
+            [*SUPPORTED_ALGORITHMS.keys(), BATCH_ALGORITHM]
+        )
         print(f"Supported algorithms: {supported_algorithms}", file=sys.stderr)
+        print(
+            "jobs: number of worker processes for the per-row algorithms "
+            "(default: 1; 0 means one per CPU)",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
     root_finder_name = sys.argv[1]
@@ -48,20 +70,55 @@ def main() -> None:
         sys.exit(1)
 
     algorithm_name = sys.argv[2]
-    if algorithm_name not in SUPPORTED_ALGORITHMS:
+    if (
+        algorithm_name not in SUPPORTED_ALGORITHMS
+        and algorithm_name != BATCH_ALGORITHM
+    ):
         print(f"Unsupported algorithm: {algorithm_name}", file=sys.stderr)
-        supported = ", ".join(SUPPORTED_ALGORITHMS.keys())
+        supported = ", ".join([*SUPPORTED_ALGORITHMS.keys(), BATCH_ALGORITHM])
         print(f"Supported algorithms: {supported}", file=sys.stderr)
         sys.exit(1)
 
+    jobs = 1
+    if len(sys.argv) == 4:
+        try:
+            jobs = int(sys.argv[3])
+        except ValueError:
+            jobs = -1
+        if jobs < 0:
+            print(f"Invalid number of jobs: {sys.argv[3]}", file=sys.stderr)
+            sys.exit(1)
+        if jobs == 0:
+            jobs = os.cpu_count() or 1
+
     root_finder = SUPPORTED_ROOT_FINDERS[root_finder_name]
-    algorithm = SUPPORTED_ALGORITHMS[algorithm_name]
+    algorithm = SUPPORTED_ALGORITHMS.get(algorithm_name)
 
-    # Parse the data
-    data_pairs = parse_efficiency_file("data.txt")
+    # Read the data straight into a (rows, 2) array; the per-row
+    # algorithms iterate over Python ints taken from it.
+    data = np.loadtxt("data.txt", dtype=np.int64, ndmin=2)
+    ks = data[:, 0]
+    ns = data[:, 1]
+    data_pairs = list(zip(ks.tolist(), ns.tolist(), strict=True))
 
     # Define the calculations function
     def run_calculations() -> None:
+        if algorithm is None:
+            effic_batch(ks, ns, 0.95)
+            return
+        if jobs > 1:
+            # Rows are independent, so they are spread over worker
+            # processes; only the dispatch shows up in this process' profile.
+            calculate = partial(
+                effic,
+                conflevel=0.95,
+                root_finder=root_finder,
+                algorithm=algorithm,
+            )
+            chunksize = max(1, len(data_pairs) // (4 * jobs))
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                list(executor.map(calculate, ks, ns, chunksize=chunksize))
+            return
         for k, n in data_pairs:
             effic(k, n, 0.95, root_finder=root_finder, algorithm=algorithm)
 
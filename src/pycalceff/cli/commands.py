@@ -4,18 +4,22 @@ CLI commands for pycalceff.
 Defines the Typer application and command handlers for the CLI interface.
 """
 
-from functools import partial
-from typing import cast
-
 import typer
-from scipy.optimize import bisect, brenth, brentq, ridder, toms748
 
 from .. import __version__ as version
 from ..core.cli_utils import (
     parse_efficiency_data,
     validate_conflevel_input,
 )
-from ..core.effic import DEFAULT_ROOT_FINDER_BRENTH, HPDAlgorithm, RootFinder
+from ..core.effic import (
+    DEFAULT_ROOT_FINDER_BISECT,
+    DEFAULT_ROOT_FINDER_BRENTH,
+    DEFAULT_ROOT_FINDER_BRENTQ,
+    DEFAULT_ROOT_FINDER_RIDDER,
+    DEFAULT_ROOT_FINDER_TOMS748,
+    HPDAlgorithm,
+    RootFinder,
+)
 
 # Supported root finders for CLI
 SUPPORTED_ROOT_FINDERS = {"bisect", "brenth", "brentq", "ridder", "toms748"}
@@ -107,12 +111,12 @@ def main(
             typer.echo(f"Supported root finders: {supported}", err=True)
             raise typer.Exit(1)
         algorithm = HPDAlgorithm.ROOT_FINDING
-        root_finder_map = {
-            "bisect": cast(RootFinder, bisect),
-            "brenth": cast(RootFinder, brenth),
-            "brentq": cast(RootFinder, brentq),
-            "ridder": cast(RootFinder, ridder),
-            "toms748": cast(RootFinder, partial(toms748, k=1)),
+        root_finder_map: dict[str, RootFinder] = {
+            "bisect": DEFAULT_ROOT_FINDER_BISECT,
+            "brenth": DEFAULT_ROOT_FINDER_BRENTH,
+            "brentq": DEFAULT_ROOT_FINDER_BRENTQ,
+            "ridder": DEFAULT_ROOT_FINDER_RIDDER,
+            "toms748": DEFAULT_ROOT_FINDER_TOMS748,
         }
         actual_root_finder = root_finder_map[root_finder_str]
     else:
@@ -4,11 +4,32 @@ CLI utility functions for pycalceff.
 Contains business logic and error handling functions used by the CLI.
 """
 
-from typing import NamedTuple, NoReturn
+import io
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, NamedTuple, NoReturn, Self, overload
 
+import numpy as np
+import numpy.typing as npt
 import typer
 
-from .effic import HPDAlgorithm, RootFinder, effic
+from .effic import HPDAlgorithm, RootFinder, effic, effic_batch
+
+# Matches a whole file made only of blank lines, comments, and pairs of
+# integers small enough for int64. Such files can be read by np.loadtxt, with
+# the same result as the line-by-line parser. The possessive quantifiers keep
+# the match linear in the file size.
+_SIMPLE_LINE = (
+    r"[ \t]*+(?:#[^\n]*+|[+-]?+[0-9]{1,18}+[ \t]++[+-]?+[0-9]{1,18}+[ \t]*+)?+"
+)
+_SIMPLE_FILE = re.compile(rf"(?:{_SIMPLE_LINE}\n)*+{_SIMPLE_LINE}")
+# A run of well-formed lines, then the (possibly malformed) line after it
+_SEGMENT = re.compile(rf"((?:{_SIMPLE_LINE}\n)*+)([^\n]*+)\n?")
+_DATA_LINE = re.compile(r"^[ \t]*[+-]?[0-9]", re.MULTILINE)
+
+# Below this many pairs, the fixed per-step cost of the NumPy calls in
+# effic_batch outweighs solving the pairs one at a time.
+_BATCH_MIN_PAIRS = 16
 
 
 class EfficiencyResult(NamedTuple):
@@ -29,10 +50,132 @@ class EfficiencyResult(NamedTuple):
         return self.high - self.low
 
 
+class EfficiencyResults(Sequence[EfficiencyResult]):
+    """
+    Results of efficiency calculations for many (k, n) pairs, stored as one
+    array per field.
+
+    Indexing and iteration yield EfficiencyResult instances, and the
+    container compares equal to any sequence of the same results, so this
+    can be used wherever a list of results is expected.
+    """
+
+    def __init__(
+        self,
+        k: npt.ArrayLike,
+        n: npt.ArrayLike,
+        mode: npt.ArrayLike,
+        low: npt.ArrayLike,
+        high: npt.ArrayLike,
+    ) -> None:
+        """
+        :param k: Numbers of successes
+        :param n: Numbers of trials
+        :param mode: Most probable efficiencies
+        :param low: Lower bounds of the confidence intervals
+        :param high: Upper bounds of the confidence intervals
+        """
+        self.k = _counts_array(k)
+        self.n = _counts_array(n)
+        self.mode = np.asarray(mode, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+
+    @classmethod
+    def from_results(cls, results: Sequence[EfficiencyResult]) -> Self:
+        """
+        Collect a sequence of results into a single container.
+
+        :param results: Efficiency calculation results
+        :returns: The results as one array per field
+        """
+        if isinstance(results, cls):
+            return results
+        return cls(
+            k=[result.k for result in results],
+            n=[result.n for result in results],
+            mode=[result.mode for result in results],
+            low=[result.low for result in results],
+            high=[result.high for result in results],
+        )
+
+    @property
+    def width(self) -> npt.NDArray[np.float64]:
+        """The widths of the confidence intervals.
+
+        :returns: The width of each confidence interval
+        """
+        return self.high - self.low
+
+    def __len__(self) -> int:
+        return len(self.k)
+
+    @overload
+    def __getitem__(self, index: int) -> EfficiencyResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> EfficiencyResult | Self:
+        if isinstance(index, slice):
+            return type(self)(
+                self.k[index],
+                self.n[index],
+                self.mode[index],
+                self.low[index],
+                self.high[index],
+            )
+        return EfficiencyResult(
+            k=int(self.k[index]),
+            n=int(self.n[index]),
+            mode=float(self.mode[index]),
+            low=float(self.low[index]),
+            high=float(self.high[index]),
+        )
+
+    def __iter__(self) -> Iterator[EfficiencyResult]:
+        for k, n, mode, low, high in zip(
+            self.k.tolist(),
+            self.n.tolist(),
+            self.mode.tolist(),
+            self.low.tolist(),
+            self.high.tolist(),
+            strict=True,
+        ):
+            yield EfficiencyResult(k=k, n=n, mode=mode, low=low, high=high)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            mine == theirs for mine, theirs in zip(self, other, strict=True)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def _counts_array(counts: npt.ArrayLike) -> npt.NDArray[Any]:
+    """
+    Store counts as int64, or as Python ints if any of them does not fit.
+
+    :param counts: Numbers of successes or trials
+    :returns: The counts as an array
+    """
+    try:
+        return np.asarray(counts, dtype=np.int64)
+    except OverflowError:
+        return np.asarray(counts, dtype=object)
+
+
 def parse_efficiency_file(filename: str) -> list[tuple[int, int]]:
     """
     Parse efficiency data file and return list of (k, n) pairs.
 
+    Files made only of blank lines, comments and pairs of integers are read
+    with np.loadtxt in one go. Otherwise the runs of such lines between the
+    offending ones are still read in bulk, and only the offending lines go
+    through the line-by-line checks, which report them.
+
     :param filename: Path to the data file
     :returns: List of (successes, trials) pairs
     :raises typer.Exit: For file not found or parsing errors
@@ -40,27 +183,10 @@ def parse_efficiency_file(filename: str) -> list[tuple[int, int]]:
     data_pairs = []
     try:
         with open(filename, encoding="utf-8") as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split()
-                if len(parts) != 2:
-                    typer.echo(
-                        f"Invalid line format on line {line_num}: {line}",
-                        err=True,
-                    )
-                    continue
-                try:
-                    k = int(parts[0])
-                    n = int(parts[1])
-                    data_pairs.append((k, n))
-                except ValueError as e:
-                    typer.echo(
-                        f"Error parsing line {line_num} '{line}': {e}",
-                        err=True,
-                    )
-                    raise typer.Exit(3) from e
+            text = f.read()
+        if _SIMPLE_FILE.fullmatch(text):
+            return _load_simple_pairs(text)
+        data_pairs = _parse_efficiency_text(text)
     except FileNotFoundError as exc:
         handle_file_not_found_error(filename, exc)
     except Exception as e:  # Catch any unexpected errors
@@ -69,20 +195,94 @@ def parse_efficiency_file(filename: str) -> list[tuple[int, int]]:
     return data_pairs
 
 
+def _load_simple_pairs(text: str) -> list[tuple[int, int]]:
+    """
+    Read (k, n) pairs from text made only of well-formed lines.
+
+    :param text: Blank lines, comment lines and lines with two integers
+    :returns: List of (successes, trials) pairs
+    """
+    if not _DATA_LINE.search(text):
+        return []
+    data = np.loadtxt(io.StringIO(text), dtype=np.int64, ndmin=2)
+    return list(zip(data[:, 0].tolist(), data[:, 1].tolist(), strict=True))
+
+
+def _parse_efficiency_text(text: str) -> list[tuple[int, int]]:
+    """
+    Parse the text of an efficiency data file that has malformed lines.
+
+    :param text: Contents of the data file
+    :returns: List of (successes, trials) pairs
+    :raises typer.Exit: If a line has two fields that are not integers
+    """
+    data_pairs = []
+    # Well-formed runs are only loaded when a pair from another line must
+    # follow them, so runs separated by skipped lines are read together.
+    pending: list[str] = []
+    line_num = 1
+    for segment in _SEGMENT.finditer(text):
+        run, line = segment.group(1, 2)
+        pending.append(run)
+        line_num += run.count("\n")
+        if line:
+            pair = _parse_efficiency_line(line, line_num)
+            if pair is not None:
+                data_pairs.extend(_load_simple_pairs("".join(pending)))
+                pending.clear()
+                data_pairs.append(pair)
+            line_num += 1
+    data_pairs.extend(_load_simple_pairs("".join(pending)))
+    return data_pairs
+
+
+def _parse_efficiency_line(line: str, line_num: int) -> tuple[int, int] | None:
+    """
+    Parse a single line of an efficiency data file.
+
+    :param line: The line to parse
+    :param line_num: Line number, for messages
+    :returns: The (successes, trials) pair, or None for a line to skip
+    :raises typer.Exit: If the line has two fields that are not integers
+    """
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    parts = line.split()
+    if len(parts) != 2:
+        typer.echo(
+            f"Invalid line format on line {line_num}: {line}",
+            err=True,
+        )
+        return None
+    try:
+        return int(parts[0]), int(parts[1])
+    except ValueError as e:
+        typer.echo(
+            f"Error parsing line {line_num} '{line}': {e}",
+            err=True,
+        )
+        raise typer.Exit(3) from e
+
+
 def calculate_efficiencies(
     data_pairs: list[tuple[int, int]],
     conflevel: float,
     algorithm: HPDAlgorithm | None = None,
     root_finder: RootFinder | None = None,
-) -> list[EfficiencyResult]:
+) -> EfficiencyResults:
     """
     Calculate efficiency confidence intervals for a list of (k, n) pairs.
 
+    With the BINARY_SEARCH algorithm, lists of at least _BATCH_MIN_PAIRS
+    pairs are computed at once by effic_batch; everything else is computed
+    pair by pair.
+
     :param data_pairs: List of (successes, trials) pairs
     :param conflevel: Confidence level for calculations
     :param algorithm: HPD algorithm to use (default: BINARY_SEARCH)
-    :param root_finder: Root-finding algorithm to use (default: brentq)
-    :returns: List of efficiency calculation results
+    :param root_finder: Root-finding algorithm to use (default: brenth)
+    :returns: Efficiency calculation results, one per pair
     """
     if algorithm is None:
         algorithm = HPDAlgorithm.BINARY_SEARCH
@@ -90,33 +290,85 @@ def calculate_efficiencies(
         from .effic import DEFAULT_ROOT_FINDER
 
         root_finder = DEFAULT_ROOT_FINDER
-    results = []
-    for k, n in data_pairs:
-        mode, low, high = effic(
-            k, n, conflevel, root_finder=root_finder, algorithm=algorithm
-        )
-        result = EfficiencyResult(k=k, n=n, mode=mode, low=low, high=high)
-        results.append(result)
-    return results
+
+    if (
+        algorithm == HPDAlgorithm.BINARY_SEARCH
+        and len(data_pairs) >= _BATCH_MIN_PAIRS
+    ):
+        batch = _batch_counts(data_pairs)
+        if batch is not None:
+            ks, ns = batch
+            modes, lows, highs = effic_batch(ks, ns, conflevel)
+            return EfficiencyResults(
+                k=ks, n=ns, mode=modes, low=lows, high=highs
+            )
+
+    intervals = [
+        effic(k, n, conflevel, root_finder=root_finder, algorithm=algorithm)
+        for k, n in data_pairs
+    ]
+    return EfficiencyResults(
+        k=[k for k, _ in data_pairs],
+        n=[n for _, n in data_pairs],
+        mode=[mode for mode, _, _ in intervals],
+        low=[low for _, low, _ in intervals],
+        high=[high for _, _, high in intervals],
+    )
 
 
-def print_efficiency_results(results: list[EfficiencyResult]) -> None:
+def _batch_counts(
+    data_pairs: list[tuple[int, int]],
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]] | None:
+    """
+    Convert (k, n) pairs to int64 arrays for effic_batch.
+
+    Pairs that are not valid inputs are left to effic, which reports them
+    the same way whatever the algorithm, and counts that do not fit in
+    int64 are left to effic, which works with Python ints.
+
+    :param data_pairs: List of (successes, trials) pairs
+    :returns: The k and n arrays, or None if the pairs cannot be batched
+    """
+    try:
+        ks = np.array([k for k, _ in data_pairs], dtype=np.int64)
+        ns = np.array([n for _, n in data_pairs], dtype=np.int64)
+    except OverflowError:
+        return None
+    if not np.all((ks >= 0) & (ks <= ns) & (ns > 0)):
+        return None
+    return ks, ns
+
+
+def print_efficiency_results(results: Sequence[EfficiencyResult]) -> None:
     """
     Print efficiency calculation results to stdout.
 
-    :param results: List of efficiency calculation results to print
+    :param results: Efficiency calculation results to print
     """
-    for result in results:
-        typer.echo(f"{result.mode:.6e} {result.low:.6e} {result.high:.6e}")
+    # Format everything first and write it in a single call. Columns are
+    # formatted directly, without creating a result object per row.
+    rows: Iterable[tuple[float, float, float]]
+    if isinstance(results, EfficiencyResults):
+        rows = zip(
+            results.mode.tolist(),
+            results.low.tolist(),
+            results.high.tolist(),
+            strict=True,
+        )
+    else:
+        rows = ((result.mode, result.low, result.high) for result in results)
+    lines = [f"{mode:.6e} {low:.6e} {high:.6e}" for mode, low, high in rows]
+    if lines:
+        typer.echo("\n".join(lines))
 
 
 def output_efficiency_results(
-    results: list[EfficiencyResult], out: str | None, use_csv: bool
+    results: Sequence[EfficiencyResult], out: str | None, use_csv: bool
 ) -> None:
     """
     Output efficiency calculation results to file or stdout.
 
-    :param results: List of efficiency calculation results
+    :param results: Efficiency calculation results
     :param out: Output file path, or None for stdout
     :param use_csv: Whether to use CSV format
     """
@@ -143,30 +395,24 @@ def output_efficiency_results(
             )
         console.print(table)
     else:
-        # Output to file
-        import csv
-
+        # Output to file, straight from the columns. CSV rows end in \r\n,
+        # as written by the csv module; no field ever needs quoting.
+        columns = EfficiencyResults.from_results(results)
+        sep, newline = (",", "\r\n") if use_csv else ("\t", "\n")
         with open(out, "w", newline="", encoding="utf-8") as f:
-            if use_csv:
-                writer = csv.writer(f)
-                writer.writerow(["k", "n", "mode", "low", "high"])
-                for result in results:
-                    writer.writerow(
-                        [
-                            result.k,
-                            result.n,
-                            f"{result.mode:.17e}",
-                            f"{result.low:.17e}",
-                            f"{result.high:.17e}",
-                        ]
-                    )
-            else:
-                f.write("k\tn\tmode\tlow\thigh\n")
-                for result in results:
-                    f.write(
-                        f"{result.k}\t{result.n}\t{result.mode:.17e}\t"
-                        f"{result.low:.17e}\t{result.high:.17e}\n"
-                    )
+            f.write(sep.join(["k", "n", "mode", "low", "high"]) + newline)
+            f.writelines(
+                f"{k}{sep}{n}{sep}{mode:.17e}{sep}{low:.17e}{sep}{high:.17e}"
+                f"{newline}"
+                for k, n, mode, low, high in zip(
+                    columns.k.tolist(),
+                    columns.n.tolist(),
+                    columns.mode.tolist(),
+                    columns.low.tolist(),
+                    columns.high.tolist(),
+                    strict=True,
+                )
+            )
 
 
 def parse_efficiency_data(
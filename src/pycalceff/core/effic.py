@@ -5,15 +5,19 @@ This module provides functions for calculating exact binomial efficiency
 confidence intervals using Bayesian methods with beta distributions.
 """
 
+import math
 from collections.abc import Callable
 from enum import Enum
-from functools import partial
-from typing import Any, Protocol, cast
+from functools import lru_cache, partial
+from typing import Any, Protocol, overload
 
 import numpy as np
-from scipy import stats
-from scipy.optimize import bisect, brenth, brentq, ridder, toms748
-from scipy.special import betainc, betaincinv, betaln
+import numpy.typing as npt
+
+# cython_special provides scalar entry points to the same special functions.
+# They skip the ufunc machinery and return Python floats, but require float
+# shape parameters; the ufuncs are kept for the array code in effic_batch.
+from scipy.special import betainc, betaincinv, betaln, cython_special
 
 
 class BoundDirection(Enum):
@@ -24,6 +28,7 @@ class BoundDirection(Enum):
 class HPDAlgorithm(Enum):
     ROOT_FINDING = "root_finding"
     BINARY_SEARCH = "binary_search"
+    NEWTON = "newton"
 
 
 class RootFinder(Protocol):
@@ -46,29 +51,129 @@ class RootFinder(Protocol):
     ) -> float: ...
 
 
-DEFAULT_ROOT_FINDER_BRENTQ = cast(RootFinder, brentq)
-DEFAULT_ROOT_FINDER_BISECT = cast(RootFinder, bisect)
-DEFAULT_ROOT_FINDER_BRENTH = cast(RootFinder, brenth)
-DEFAULT_ROOT_FINDER_RIDDER = cast(RootFinder, ridder)
-DEFAULT_ROOT_FINDER_TOMS748 = cast(RootFinder, partial(toms748, k=1))
-DEFAULT_ROOT_FINDER = DEFAULT_ROOT_FINDER_BRENTQ
+class _LazyRootFinder:
+    """
+    A scipy.optimize root finder that is imported on first use.
+
+    Importing scipy.optimize takes most of the start-up time of the CLI, and
+    the default HPD algorithm never calls a root finder.
+    """
+
+    def __init__(self, name: str, **options: Any) -> None:
+        """
+        :param name: Name of the root finder in scipy.optimize
+        :param options: Extra keyword arguments to pass on every call
+        """
+        self._name = name
+        self._options = options
+        self._finder: Callable[..., float] | None = None
+
+    def __call__(
+        self,
+        f: Callable[[float], float],
+        a: float,
+        b: float,
+        *args: Any,
+        **kwargs: Any,
+    ) -> float:
+        if self._finder is None:
+            import scipy.optimize
+
+            self._finder = partial(
+                getattr(scipy.optimize, self._name), **self._options
+            )
+        return self._finder(f, a, b, *args, **kwargs)
+
+    def _key(self) -> tuple[str, tuple[tuple[str, Any], ...]]:
+        return self._name, tuple(sorted(self._options.items()))
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _LazyRootFinder):
+            return NotImplemented
+        return self._key() == other._key()
 
-def posterior_density(x: float, k: int, ntrials: int) -> float:
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        options = "".join(f", {k}={v!r}" for k, v in self._options.items())
+        return f"{type(self).__name__}({self._name!r}{options})"
+
+
+DEFAULT_ROOT_FINDER_BRENTQ: RootFinder = _LazyRootFinder("brentq")
+DEFAULT_ROOT_FINDER_BISECT: RootFinder = _LazyRootFinder("bisect")
+DEFAULT_ROOT_FINDER_BRENTH: RootFinder = _LazyRootFinder("brenth")
+DEFAULT_ROOT_FINDER_RIDDER: RootFinder = _LazyRootFinder("ridder")
+DEFAULT_ROOT_FINDER_TOMS748: RootFinder = _LazyRootFinder("toms748", k=1)
+DEFAULT_ROOT_FINDER = DEFAULT_ROOT_FINDER_BRENTH
+
+
+def _posterior_density(
+    x: float, k: int, ntrials: int, log_norm: float
+) -> float:
     """
-    Compute the posterior density of the beta distribution
-    Beta(k+1, N-k+1) at point x.
+    Compute the posterior density of Beta(k+1, N-k+1) at point x, given the
+    precomputed log normalization betaln(k+1, N-k+1).
 
     :param x: Point at which to evaluate the density (0 ≤ x ≤ 1)
     :param k: Number of successes
     :param ntrials: Number of trials
+    :param log_norm: The value of betaln(k+1, N-k+1)
     :returns: The density value at x
     """
-    if not (0 <= x <= 1):
+    if not (0 < x < 1):
+        # At the endpoints the density is nonzero only if the corresponding
+        # exponent vanishes; outside [0, 1] it is always zero.
+        if (x == 0 and k == 0) or (x == 1 and k == ntrials):
+            return math.exp(-log_norm)
         return 0.0
-    alpha = k + 1
-    beta = ntrials - k + 1
-    return float(stats.beta.pdf(x, alpha, beta))
+    return math.exp(
+        k * math.log(x) + (ntrials - k) * math.log1p(-x) - log_norm
+    )
+
+
+@overload
+def posterior_density(x: float, k: int, ntrials: int) -> float: ...
+
+
+@overload
+def posterior_density(
+    x: npt.NDArray[np.float64], k: int, ntrials: int
+) -> npt.NDArray[np.float64]: ...
+
+
+def posterior_density(
+    x: float | npt.NDArray[np.float64], k: int, ntrials: int
+) -> float | npt.NDArray[np.float64]:
+    """
+    Compute the posterior density of the beta distribution
+    Beta(k+1, N-k+1) at point x.
+
+    Array input is evaluated elementwise without Python-level branching
+    and returns an array of the same shape; scalar input returns a float.
+
+    :param x: Point(s) at which to evaluate the density (0 ≤ x ≤ 1)
+    :param k: Number of successes
+    :param ntrials: Number of trials
+    :returns: The density value at x
+    """
+    log_norm = cython_special.betaln(k + 1.0, ntrials - k + 1.0)
+    if not isinstance(x, np.ndarray):
+        return _posterior_density(x, k, ntrials, log_norm)
+
+    x = x.astype(np.float64, copy=False)
+    inside = (x > 0) & (x < 1)
+    # Evaluate the logs at a harmless point outside (0, 1) and mask the
+    # result afterwards, with the same endpoint rule as the scalar case.
+    safe_x = np.where(inside, x, 0.5)
+    density = np.exp(
+        k * np.log(safe_x) + (ntrials - k) * np.log1p(-safe_x) - log_norm
+    )
+    at_endpoint = ((x == 0) & (k == 0)) | ((x == 1) & (k == ntrials))
+    result: npt.NDArray[np.float64] = np.where(
+        inside, density, np.where(at_endpoint, math.exp(-log_norm), 0.0)
+    )
+    return result
 
 
 def probability_mass(k: int, ntrials: int, low: float, high: float) -> float:
@@ -82,10 +187,14 @@ def probability_mass(k: int, ntrials: int, low: float, high: float) -> float:
     :param high: Upper bound of the interval (0 ≤ low < high ≤ 1)
     :returns: Probability mass between low and high
     """
-    alpha = k + 1
-    beta = ntrials - k + 1
-    return float(
-        stats.beta.cdf(high, alpha, beta) - stats.beta.cdf(low, alpha, beta)
+    alpha = k + 1.0
+    beta = ntrials - k + 1.0
+    # The CDF is 0 below the support and 1 above it; betainc itself returns
+    # nan outside [0, 1], so clamp the bounds first.
+    low = min(max(low, 0.0), 1.0)
+    high = min(max(high, 0.0), 1.0)
+    return cython_special.betainc(alpha, beta, high) - cython_special.betainc(
+        alpha, beta, low
     )
 
 
@@ -97,15 +206,16 @@ def compute_hpd_interval_k_zero(
     """
     Compute the highest posterior density (HPD) interval for the case k=0.
 
+    The posterior density is decreasing, so the interval is [0, q], where q
+    is the conflevel quantile of Beta(1, N+1).
+
     :param ntrials: Number of trials
     :param conflevel: Confidence level (0 < conflevel < 1)
-    :param root_finder: Root-finding algorithm to use (default: brentq)
+    :param root_finder: Unused; the bound is computed in closed form
     :returns: Tuple of (low, high) bounds of the HPD interval
     """
     low = 0.0
-    high = search_bound(
-        low, 0, ntrials, conflevel, BoundDirection.UPPER, root_finder
-    )
+    high = cython_special.betaincinv(1.0, ntrials + 1.0, conflevel)
     return low, high
 
 
@@ -118,15 +228,16 @@ def compute_hpd_interval_k_ntrials(
     Compute the highest posterior density (HPD) interval
     for the case k=ntrials.
 
+    The posterior density is increasing, so the interval is [q, 1], where q
+    is the (1 - conflevel) quantile of Beta(N+1, 1).
+
     :param ntrials: Number of trials
     :param conflevel: Confidence level (0 < conflevel < 1)
-    :param root_finder: Root-finding algorithm to use (default: brentq)
+    :param root_finder: Unused; the bound is computed in closed form
     :returns: Tuple of (low, high) bounds of the HPD interval
     """
+    low = cython_special.betaincinv(ntrials + 1.0, 1.0, 1.0 - conflevel)
     high = 1.0
-    low = search_bound(
-        high, ntrials, ntrials, conflevel, BoundDirection.LOWER, root_finder
-    )
     return low, high
 
 
@@ -140,35 +251,165 @@ def compute_hpd_interval_general(
     Compute the highest posterior density (HPD) interval
     for 0 < k < ntrials. Note the strict inequality.
 
+    The lower bound a determines the upper bound b through the mass
+    condition, F(b) = F(a) + conflevel, so a single root find on a for the
+    equal-height condition f(a) = f(b) gives the interval, with the mass
+    exact by construction.
+
     :param k: Number of successes
     :param ntrials: Number of trials
     :param conflevel: Confidence level (0 < conflevel < 1)
-    :param root_finder: Root-finding algorithm to use (default: brentq)
+    :param root_finder: Root-finding algorithm to use (default: brenth)
     :returns: Tuple of (low, high) bounds of the HPD interval
     """
     assert 0 < k < ntrials, "k must be between 0 and ntrials"
     # Find the mode
     mode = k / ntrials
 
-    # Use root_finder to find h such that the mass above h equals conflevel
-    def mass_diff(h: float) -> float:
-        def f(x: float) -> float:
-            return posterior_density(x, k, ntrials) - h
+    # The shape parameters and normalization are the same for every density
+    # and mass evaluation below, so compute them once rather than on each
+    # call.
+    alpha = k + 1.0
+    beta_param = ntrials - k + 1.0
+    log_norm = cython_special.betaln(alpha, beta_param)
+    nfailures = ntrials - k
+
+    def density(x: float) -> float:
+        # The density vanishes at both endpoints, since 0 < k < ntrials.
+        if not (0 < x < 1):
+            return 0.0
+        return math.exp(
+            k * math.log(x) + nfailures * math.log1p(-x) - log_norm
+        )
+
+    def upper_bound(a: float) -> float:
+        mass_below = cython_special.betainc(alpha, beta_param, a)
+        # The inverse can round to just below a when conflevel is too small
+        # for F to resolve.
+        return max(
+            a,
+            cython_special.betaincinv(
+                alpha, beta_param, min(mass_below + conflevel, 1.0)
+            ),
+        )
+
+    # Negative while a is below the HPD lower bound, positive above it. The
+    # densities, rather than their logs, keep it finite at a = 0 and b = 1.
+    def height_diff(a: float) -> float:
+        b = upper_bound(a)
+        if not (0 < a and b < 1):
+            return density(a) - density(b)
+        # f(a) - f(b) = f(b) * expm1(log f(a) - log f(b)), with the log ratio
+        # written in terms of b - a. Evaluating f(a) and f(b) separately
+        # leaves rounding noise larger than their difference when the
+        # interval is narrow and ntrials is large.
+        width = b - a
+        log_ratio = k * math.log1p(-width / b) + nfailures * math.log1p(
+            width / (1 - b)
+        )
+        return density(b) * math.expm1(log_ratio)
 
-        a = root_finder(f, 0, mode, xtol=1e-14)
-        b = root_finder(f, mode, 1, xtol=1e-14)
-        mass = beta_ab(a, b, k, ntrials)
-        return mass - conflevel
+    # a cannot exceed the mode, nor leave less than conflevel above it.
+    a_max = min(
+        mode, cython_special.betaincinv(alpha, beta_param, 1.0 - conflevel)
+    )
+    # Rounding can remove the sign change at either end of the bracket, e.g.
+    # when a small conflevel and a large ntrials make b(a_max) - a_max too
+    # narrow to resolve. The residual then vanishes at that end to working
+    # precision, so that end is the lower bound.
+    if height_diff(a_max) <= 0.0:
+        return a_max, upper_bound(a_max)
+    if height_diff(0.0) >= 0.0:
+        return 0.0, upper_bound(0.0)
+    a = root_finder(height_diff, 0.0, a_max, xtol=1e-14)
+    return a, upper_bound(a)
+
+
+def compute_hpd_interval_newton(
+    k: int,
+    ntrials: int,
+    conflevel: float,
+    root_finder: RootFinder = DEFAULT_ROOT_FINDER,
+    maxiter: int = 50,
+) -> tuple[float, float]:
+    """
+    Compute the highest posterior density (HPD) interval
+    for 0 < k < ntrials, by applying Newton's method to the pair of
+    conditions pdf(a) = pdf(b) and F(b) - F(a) = conflevel.
 
-    h = float(root_finder(mass_diff, 0.0, posterior_density(mode, k, ntrials)))
+    If the iteration does not converge, the interval is computed with
+    compute_hpd_interval_general instead.
 
-    # Find the roots with the converged h
-    def g(x: float) -> float:
-        return posterior_density(x, k, ntrials) - h
+    :param k: Number of successes
+    :param ntrials: Number of trials
+    :param conflevel: Confidence level (0 < conflevel < 1)
+    :param root_finder: Root-finding algorithm to use for the fallback
+        (default: brenth)
+    :param maxiter: Maximum number of Newton iterations
+    :returns: Tuple of (low, high) bounds of the HPD interval
+    """
+    assert 0 < k < ntrials, "k must be between 0 and ntrials"
+    mode = k / ntrials
+    alpha = k + 1.0
+    beta_param = ntrials - k + 1.0
+    log_norm = cython_special.betaln(alpha, beta_param)
+    nfailures = ntrials - k
+
+    def log_kernel(x: float) -> float:
+        return k * math.log(x) + nfailures * math.log1p(-x)
+
+    def dlog_kernel(x: float) -> float:
+        return k / x - nfailures / (1 - x)
+
+    # Start from the interval that excludes mass on either side of the mode
+    # in proportion to the mass on that side; it always contains the mode,
+    # and it is the equal-tailed interval when the posterior is symmetric.
+    mass_below_mode = cython_special.betainc(alpha, beta_param, mode)
+    p_low = mass_below_mode * (1 - conflevel)
+    a = cython_special.betaincinv(alpha, beta_param, p_low)
+    b = cython_special.betaincinv(alpha, beta_param, p_low + conflevel)
+    previous_size = math.inf
+    for _ in range(maxiter):
+        if not (0 < a < mode < b < 1):
+            break
+        # Equal height, in log space, and the mass condition. The log ratio
+        # is written in terms of b - a so that it does not cancel for large
+        # ntrials.
+        f1 = k * math.log1p((a - b) / b) + nfailures * math.log1p(
+            (b - a) / (1 - b)
+        )
+        f2 = cython_special.betainc(
+            alpha, beta_param, b
+        ) - cython_special.betainc(alpha, beta_param, a)
+        f2 -= conflevel
+        # Jacobian of (f1, f2) with respect to (a, b).
+        j11 = dlog_kernel(a)
+        j12 = -dlog_kernel(b)
+        j21 = -math.exp(log_kernel(a) - log_norm)
+        j22 = math.exp(log_kernel(b) - log_norm)
+        det = j11 * j22 - j12 * j21
+        if det == 0 or not math.isfinite(det):
+            break
+        da = (f1 * j22 - f2 * j12) / det
+        db = (f2 * j11 - f1 * j21) / det
+        # Halve the step until it stays within the domain.
+        step = 1.0
+        while not (0 < a - step * da < mode < b - step * db < 1):
+            step /= 2
+            if step < 1e-10:
+                break
+        if step < 1e-10:
+            break
+        a -= step * da
+        b -= step * db
+        # Stop when the relative step is negligible, or when it is small
+        # but no longer shrinking, which means rounding errors dominate.
+        size = max(abs(da) / a, abs(db) / b)
+        if size <= 1e-13 or (size <= 1e-9 and size >= previous_size):
+            return a, b
+        previous_size = size
 
-    a = root_finder(g, 0, mode, xtol=1e-14)
-    b = root_finder(g, mode, 1, xtol=1e-14)
-    return a, b
+    return compute_hpd_interval_general(k, ntrials, conflevel, root_finder)
 
 
 def compute_hpd_interval(
@@ -185,23 +426,24 @@ def compute_hpd_interval(
     :param k: Number of successes
     :param ntrials: Number of trials
     :param conflevel: Confidence level (0 < conflevel < 1)
-    :param root_finder: Root-finding algorithm to use (default: brentq)
+    :param root_finder: Root-finding algorithm to use (default: brenth)
     :param algorithm: HPD interval algorithm to use
         (default: BINARY_SEARCH)
     :returns: Tuple of (low, high) bounds of the HPD interval
     """
     if k == 0:
         return compute_hpd_interval_k_zero(ntrials, conflevel, root_finder)
-    elif k == ntrials:
+    if k == ntrials:
         return compute_hpd_interval_k_ntrials(ntrials, conflevel, root_finder)
-    else:
-        if algorithm == HPDAlgorithm.ROOT_FINDING:
-            return compute_hpd_interval_general(
-                k, ntrials, conflevel, root_finder
-            )
-        else:  # BINARY_SEARCH
-            a, b = shortest_hpd_beta(k, ntrials, conflevel)
-            return a, b
+    if algorithm == HPDAlgorithm.ROOT_FINDING:
+        return compute_hpd_interval_general(k, ntrials, conflevel, root_finder)
+    if algorithm == HPDAlgorithm.NEWTON:
+        return compute_hpd_interval_newton(k, ntrials, conflevel, root_finder)
+    # BINARY_SEARCH
+    return shortest_hpd_beta(k, ntrials, conflevel)
+
+
+_compute_hpd_interval_cached = lru_cache(maxsize=4096)(compute_hpd_interval)
 
 
 def beta_ab(a: float, b: float, k: int, ntrials: int) -> float:
@@ -217,9 +459,19 @@ def beta_ab(a: float, b: float, k: int, ntrials: int) -> float:
     """
     if a == b:
         return 0.0
-    c1 = k + 1
-    c2 = ntrials - k + 1
-    return float(betainc(c1, c2, b) - betainc(c1, c2, a))
+    c1 = k + 1.0
+    c2 = ntrials - k + 1.0
+    # The regularized incomplete beta function is 0 at x=0 and 1 at x=1, so
+    # an interval ending at either boundary needs only one evaluation.
+    if a <= 0.0:
+        if b >= 1.0:
+            return 1.0
+        return cython_special.betainc(c1, c2, b)
+    if b >= 1.0:
+        return 1.0 - cython_special.betainc(c1, c2, a)
+    return cython_special.betainc(c1, c2, b) - cython_special.betainc(
+        c1, c2, a
+    )
 
 
 def search_bound(
@@ -228,22 +480,30 @@ def search_bound(
     ntrials: int,
     conflevel: float,
     direction: BoundDirection,
-    root_finder: RootFinder = DEFAULT_ROOT_FINDER_BISECT,
+    root_finder: RootFinder = DEFAULT_ROOT_FINDER,
 ) -> float:
     """
     Find the boundary (upper or lower) of the integration region that contains
     probability content conflevel, starting/ending at the given bound.
 
+    The boundary is where the posterior CDF differs from its value at the
+    fixed bound by conflevel, so it is computed by inverting the CDF with
+    betaincinv.
+
     :param bound: The fixed bound (low for upper search, high for lower search)
     :param k: Number of successes
     :param ntrials: Number of trials
     :param conflevel: Probability content
     :param direction: Direction of search (UPPER or LOWER)
-    :param root_finder: Root-finding algorithm to use (default: bisect)
+    :param root_finder: Unused; the boundary is computed in closed form
     :returns: The boundary value
     """
+    c1 = k + 1.0
+    c2 = ntrials - k + 1.0
+    base = cython_special.betainc(c1, c2, bound)
+
     if direction == BoundDirection.UPPER:
-        integral = beta_ab(bound, 1.0, k, ntrials)
+        integral = 1.0 - base
         if integral == conflevel:
             return 1.0
         if integral < conflevel:
@@ -251,16 +511,9 @@ def search_bound(
                 "Cannot find upper bound: insufficient mass from "
                 f"{bound} to 1.0 (integral={integral}, required={conflevel})"
             )
-
-        def func(x: float) -> float:
-            return beta_ab(bound, x, k, ntrials) - conflevel
-
-        a, b = bound, 1.0
-        error_msg = (
-            f"Bisection failed for upper bound search from {bound} to 1.0"
-        )
+        target = min(base + conflevel, 1.0)
     elif direction == BoundDirection.LOWER:
-        integral = beta_ab(0.0, bound, k, ntrials)
+        integral = base
         if integral == conflevel:
             return 0.0
         if integral < conflevel:
@@ -268,21 +521,11 @@ def search_bound(
                 "Cannot find lower bound: insufficient mass from "
                 f"0.0 to {bound} (integral={integral}, required={conflevel})"
             )
-
-        def func(x: float) -> float:
-            return beta_ab(x, bound, k, ntrials) - conflevel
-
-        a, b = 0.0, bound
-        error_msg = (
-            f"Bisection failed for lower bound search from 0.0 to {bound}"
-        )
+        target = max(base - conflevel, 0.0)
     else:
         raise ValueError("Invalid direction")
 
-    try:
-        return float(root_finder(func, a, b, xtol=1e-12))
-    except ValueError:
-        raise ValueError(error_msg) from None
+    return cython_special.betaincinv(c1, c2, target)
 
 
 def beta_logpdf(x: float, k: int, ntrials: int) -> float:
@@ -296,14 +539,14 @@ def beta_logpdf(x: float, k: int, ntrials: int) -> float:
     :param ntrials: Number of trials (ntrials >= max(1,k))
     :returns: The log PDF value at x
     """
-    alpha = k + 1
-    beta_param = ntrials - k + 1
-    log_pdf = (
-        (alpha - 1) * np.log(x)
-        + (beta_param - 1) * np.log(1 - x)
-        - betaln(alpha, beta_param)
-    )
-    return float(log_pdf)
+    log_norm = cython_special.betaln(k + 1.0, ntrials - k + 1.0)
+    if not (0 < x < 1):
+        # As in _posterior_density: finite at an endpoint only if the
+        # corresponding exponent vanishes, and -inf everywhere else.
+        if (x == 0 and k == 0) or (x == 1 and k == ntrials):
+            return -log_norm
+        return -math.inf
+    return k * math.log(x) + (ntrials - k) * math.log1p(-x) - log_norm
 
 
 def beta_pdf(x: float, k: int, ntrials: int) -> float:
@@ -315,7 +558,7 @@ def beta_pdf(x: float, k: int, ntrials: int) -> float:
     :param ntrials: Number of trials (ntrials >= max(1,k))
     :returns: The PDF value at x
     """
-    return float(np.exp(beta_logpdf(x, k, ntrials)))
+    return math.exp(beta_logpdf(x, k, ntrials))
 
 
 def shortest_hpd_beta(
@@ -339,8 +582,8 @@ def shortest_hpd_beta(
     :param tol: Tolerance for the binary search convergence
     :returns: Tuple (a, b) where a, b are the bounds of the HPD interval
     """
-    alpha = k + 1
-    beta_param = ntrials - k + 1
+    alpha = k + 1.0
+    beta_param = ntrials - k + 1.0
 
     # Mode of the posterior Beta distribution
     mode = k / ntrials
@@ -354,13 +597,13 @@ def shortest_hpd_beta(
         :returns: Difference in log PDF values (should be 0 for equal height)
         """
         # b such that CDF(b) - CDF(a) = conflevel
-        Fa = betainc(alpha, beta_param, a)
+        Fa = cython_special.betainc(alpha, beta_param, a)
         Fb_target = Fa + conflevel
         if Fb_target > 1:
             return 1.0  # Boundary case
 
         # Invert CDF to find b
-        b = float(betaincinv(alpha, beta_param, Fb_target))
+        b = cython_special.betaincinv(alpha, beta_param, Fb_target)
 
         # Equal height condition: pdf(a) = pdf(b)
         return beta_logpdf(a, k, ntrials) - beta_logpdf(b, k, ntrials)
@@ -375,8 +618,8 @@ def shortest_hpd_beta(
             a_left = a_mid
 
     a_opt = (a_left + a_right) / 2
-    Fa = betainc(alpha, beta_param, a_opt)
-    b_opt = float(betaincinv(alpha, beta_param, Fa + conflevel))
+    Fa = cython_special.betainc(alpha, beta_param, a_opt)
+    b_opt = cython_special.betaincinv(alpha, beta_param, Fa + conflevel)
 
     return a_opt, b_opt
 
@@ -394,7 +637,7 @@ def effic(
     :param k: Number of successes
     :param ntrials: Number of trials
     :param conflevel: Confidence level (0 < conflevel < 1)
-    :param root_finder: Root-finding algorithm to use (default: brentq)
+    :param root_finder: Root-finding algorithm to use (default: brenth)
     :param algorithm: HPD interval algorithm to use
         (default: BINARY_SEARCH)
     :returns: A tuple of (mode, low, high) where mode is the most probable
@@ -407,9 +650,116 @@ def effic(
     # Most probable value
     mode = k / ntrials
 
-    # Highest posterior density interval
-    low, high = compute_hpd_interval(
-        k, ntrials, conflevel, root_finder, algorithm
-    )
+    # Highest posterior density interval. For k = 0 and k = N it is a
+    # one-sided quantile, which is cheaper to compute than to look up.
+    # Other identical requests are common (e.g. repeated rows in a data
+    # file), so results are memoized for the module's own root finders,
+    # which compare by name. Any other callable is used uncached, so that
+    # the cache neither misses on fresh closures nor keeps them alive.
+    if k == 0:
+        low, high = compute_hpd_interval_k_zero(ntrials, conflevel)
+    elif k == ntrials:
+        low, high = compute_hpd_interval_k_ntrials(ntrials, conflevel)
+    elif isinstance(root_finder, _LazyRootFinder):
+        low, high = _compute_hpd_interval_cached(
+            k, ntrials, conflevel, root_finder, algorithm
+        )
+    else:
+        low, high = compute_hpd_interval(
+            k, ntrials, conflevel, root_finder, algorithm
+        )
 
     return mode, low, high
+
+
+def effic_batch(
+    k: npt.ArrayLike,
+    ntrials: npt.ArrayLike,
+    conflevel: float,
+    tol: float = 2e-12,
+) -> tuple[
+    npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]
+]:
+    """
+    Calculate the Bayesian efficiency for many (k, N) pairs at once.
+
+    This is the vectorized counterpart of effic with the BINARY_SEARCH
+    algorithm: the bisection of shortest_hpd_beta is run for all pairs
+    simultaneously, so each step costs one call to betainc and betaincinv
+    over the whole array rather than one Python-level iteration per pair.
+
+    :param k: Numbers of successes
+    :param ntrials: Numbers of trials (broadcast against k)
+    :param conflevel: Confidence level (0 < conflevel < 1)
+    :param tol: Tolerance for the binary search convergence
+    :returns: A tuple of arrays (mode, low, high), one entry per pair
+    :raises ValueError: If conflevel is not between 0 and 1
+    """
+    if not (0 < conflevel < 1):
+        raise ValueError("conflevel must be between 0 and 1")
+
+    k_arr, n_arr = np.broadcast_arrays(
+        np.asarray(k, dtype=np.int64), np.asarray(ntrials, dtype=np.int64)
+    )
+    shape = k_arr.shape
+    k_arr = k_arr.ravel()
+    n_arr = n_arr.ravel()
+    alpha = (k_arr + 1).astype(np.float64)
+    beta_param = (n_arr - k_arr + 1).astype(np.float64)
+    log_norm = betaln(alpha, beta_param)
+    mode = k_arr / n_arr
+
+    def log_density(
+        x: npt.NDArray[np.float64], idx: npt.NDArray[np.intp]
+    ) -> npt.NDArray[np.float64]:
+        log_pdf: npt.NDArray[np.float64] = (
+            (alpha[idx] - 1) * np.log(x)
+            + (beta_param[idx] - 1) * np.log1p(-x)
+            - log_norm[idx]
+        )
+        return log_pdf
+
+    # Binary search for the lower bound in [0, mode], for all pairs at once.
+    # Pairs that have converged are left untouched, so every pair follows
+    # exactly the sequence of steps that shortest_hpd_beta would take.
+    a_left = np.zeros_like(mode)
+    a_right = mode.copy()
+    general = (k_arr > 0) & (k_arr < n_arr)
+    with np.errstate(divide="ignore"):
+        while True:
+            idx = np.flatnonzero(general & (a_right - a_left > tol))
+            if idx.size == 0:
+                break
+            a_mid = (a_left[idx] + a_right[idx]) / 2
+            fb_target = betainc(alpha[idx], beta_param[idx], a_mid) + conflevel
+            b = betaincinv(
+                alpha[idx], beta_param[idx], np.minimum(fb_target, 1.0)
+            )
+            # Equal height condition: pdf(a) = pdf(b)
+            height_diff = np.where(
+                fb_target > 1,
+                1.0,
+                log_density(a_mid, idx) - log_density(b, idx),
+            )
+            move_right = height_diff > 0
+            a_right[idx] = np.where(move_right, a_mid, a_right[idx])
+            a_left[idx] = np.where(move_right, a_left[idx], a_mid)
+
+    low = (a_left + a_right) / 2
+    high = betaincinv(
+        alpha,
+        beta_param,
+        np.minimum(betainc(alpha, beta_param, low) + conflevel, 1.0),
+    )
+
+    # The k = 0 and k = N intervals are one-sided quantiles.
+    k_zero = k_arr == 0
+    k_ntrials = k_arr == n_arr
+    low = np.where(k_zero, 0.0, low)
+    high = np.where(k_zero, betaincinv(alpha, beta_param, conflevel), high)
+    low = np.where(
+        k_ntrials, betaincinv(alpha, beta_param, 1.0 - conflevel), low
+    )
+    high = np.where(k_ntrials, 1.0, high)
+
+    return mode.reshape(shape), low.reshape(shape), high.reshape(shape)
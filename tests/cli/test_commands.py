@@ -4,6 +4,7 @@ Tests for CLI commands.
 Tests the Typer-based command-line interface commands.
 """
 
+import subprocess
 import sys
 from pathlib import Path
 
@@ -107,3 +108,12 @@ def test_invalid_root_finder() -> None:
         assert result.exit_code != 0
     finally:
         test_file.unlink()
+
+
+def test_root_finders_imported_lazily() -> None:
+    """Test that the CLI does not import scipy.optimize until needed."""
+    code = (
+        "import sys, pycalceff.cli.commands; "
+        "assert 'scipy.optimize' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -12,6 +12,7 @@ from pytest import CaptureFixture
 
 from pycalceff.core.cli_utils import (
     EfficiencyResult,
+    EfficiencyResults,
     calculate_efficiencies,
     output_efficiency_results,
     parse_and_validate_conflevel,
@@ -21,6 +22,7 @@ from pycalceff.core.cli_utils import (
     validate_confidence_level,
     validate_conflevel_input,
 )
+from pycalceff.core.effic import HPDAlgorithm, effic
 
 
 def test_parse_efficiency_file_valid(tmp_path: Path) -> None:
@@ -73,6 +75,39 @@ def test_parse_efficiency_file_invalid_format(
     assert "Invalid line format on line 4:" in captured.err
 
 
+def test_parse_efficiency_file_mixed_lines(
+    tmp_path: Path, capsys: CaptureFixture[str]
+) -> None:
+    """Test that pairs keep file order around lines needing special care."""
+    data_file = tmp_path / "mixed.txt"
+    data_file.write_text(
+        "# header\n1 2\n\n3 4\nbad\n5 6\n1_000 2_000\n7 8\nx y z\n9 10"
+    )
+
+    result = parse_efficiency_file(str(data_file))
+
+    assert result == [(1, 2), (3, 4), (5, 6), (1000, 2000), (7, 8), (9, 10)]
+    captured = capsys.readouterr()
+    assert captured.err.splitlines() == [
+        "Invalid line format on line 5: bad",
+        "Invalid line format on line 9: x y z",
+    ]
+
+
+def test_parse_efficiency_file_trailing_comment(
+    tmp_path: Path, capsys: CaptureFixture[str]
+) -> None:
+    """Test that a trailing comment makes a line invalid, as it always has."""
+    data_file = tmp_path / "trailing.txt"
+    data_file.write_text("10 20\n5 15 # note\n3 10\n")
+
+    result = parse_efficiency_file(str(data_file))
+
+    assert result == [(10, 20), (3, 10)]
+    captured = capsys.readouterr()
+    assert "Invalid line format on line 2:" in captured.err
+
+
 def test_parse_efficiency_file_file_not_found() -> None:
     """Test handling of file not found."""
     with pytest.raises(typer.Exit):
@@ -93,6 +128,68 @@ def test_calculate_efficiencies() -> None:
         assert 0 <= result.low <= result.mode <= result.high <= 1
 
 
+@pytest.mark.parametrize("algorithm", list(HPDAlgorithm))
+@pytest.mark.parametrize("repeats", [1, 4])
+def test_calculate_efficiencies_matches_effic(
+    algorithm: HPDAlgorithm, repeats: int
+) -> None:
+    """Test that every algorithm agrees with effic pair by pair, for short
+    lists and for lists long enough to be computed as a batch."""
+    data_pairs = [(0, 5), (5, 5), (3, 7), (3, 7), (40, 100)] * repeats
+    results = calculate_efficiencies(data_pairs, 0.9, algorithm=algorithm)
+
+    assert [(r.k, r.n) for r in results] == data_pairs
+    for result in results:
+        mode, low, high = effic(result.k, result.n, 0.9)
+        assert result.mode == mode
+        assert result.low == pytest.approx(low, abs=1e-10)
+        assert result.high == pytest.approx(high, abs=1e-10)
+
+
+@pytest.mark.parametrize("repeats", [1, 16])
+def test_calculate_efficiencies_large_n(repeats: int) -> None:
+    """Test that counts too large for int64 fall back to effic."""
+    data_pairs = [(1, 10**20)] * repeats
+    results = calculate_efficiencies(data_pairs, 0.9)
+
+    assert len(results) == repeats
+    for result in results:
+        assert (result.k, result.n) == (1, 10**20)
+        assert (result.mode, result.low, result.high) == effic(1, 10**20, 0.9)
+
+
+def test_efficiency_results_container() -> None:
+    """Test that EfficiencyResults behaves as a sequence of results."""
+    rows = [
+        EfficiencyResult(k=10, n=20, mode=0.5, low=0.3, high=0.7),
+        EfficiencyResult(k=8, n=10, mode=0.8, low=0.6, high=0.9),
+        EfficiencyResult(k=0, n=4, mode=0.0, low=0.0, high=0.4),
+    ]
+    results = EfficiencyResults.from_results(rows)
+
+    assert len(results) == 3
+    assert list(results) == rows
+    assert results[1] == rows[1]
+    assert results[-1] == rows[-1]
+    assert isinstance(results[0].k, int)
+    assert list(results[1:]) == rows[1:]
+    assert results.width.tolist() == [row.width for row in rows]
+    assert EfficiencyResults.from_results(results) is results
+    assert results == rows
+    assert results != rows[:2]
+    assert results != "not results"
+
+
+def test_efficiency_results_large_counts() -> None:
+    """Test that counts too large for int64 are kept as Python ints."""
+    row = EfficiencyResult(k=1, n=10**20, mode=1e-20, low=5e-21, high=7e-20)
+    results = EfficiencyResults.from_results([row])
+
+    assert results[0] == row
+    assert results[0].n == 10**20
+    assert list(results) == [row]
+
+
 def test_print_efficiency_results(capsys: CaptureFixture[str]) -> None:
     """Test printing efficiency results."""
     results = [
@@ -110,6 +207,25 @@ def test_print_efficiency_results(capsys: CaptureFixture[str]) -> None:
     assert "8.000000e-01" in lines[1]
 
 
+def test_print_efficiency_results_columns(capsys: CaptureFixture[str]) -> None:
+    """Test that EfficiencyResults print the same as a list of results."""
+    results = calculate_efficiencies([(10, 20), (0, 3), (8, 10)], 0.8)
+
+    print_efficiency_results(results)
+    from_columns = capsys.readouterr().out
+    print_efficiency_results(list(results))
+    from_rows = capsys.readouterr().out
+
+    assert from_columns == from_rows
+    assert len(from_columns.splitlines()) == 3
+
+
+def test_print_efficiency_results_empty(capsys: CaptureFixture[str]) -> None:
+    """Test that printing no results prints nothing."""
+    print_efficiency_results([])
+    assert capsys.readouterr().out == ""
+
+
 def test_validate_confidence_level_valid() -> None:
     """Test validating valid confidence level."""
     # Should not raise
@@ -210,3 +326,20 @@ def test_output_efficiency_results_to_file(tmp_path: Path) -> None:
     assert len(lines) == 3
     assert "10,20," in lines[1]
     assert "8,10," in lines[2]
+
+
+@pytest.mark.parametrize("use_csv", [False, True])
+def test_output_efficiency_results_large_n(
+    tmp_path: Path, use_csv: bool
+) -> None:
+    """Test writing a plain list of results whose n exceeds int64."""
+    results = [
+        EfficiencyResult(k=1, n=10**20, mode=1e-20, low=5e-21, high=7e-20)
+    ]
+    out_file = tmp_path / "output.txt"
+    output_efficiency_results(results, str(out_file), use_csv)
+
+    lines = out_file.read_text().strip().split("\n")
+    sep = "," if use_csv else "\t"
+    assert len(lines) == 2
+    assert lines[1].startswith(f"1{sep}{10**20}{sep}")
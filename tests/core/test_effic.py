@@ -4,15 +4,34 @@ Tests for core efficiency calculation functions.
 Tests the mathematical functions in effic.py using unit tests and hypothesis.
 """
 
+import math
+import pickle
+from typing import Any
+
+import numpy as np
 import pytest
 import scipy.stats as stats
+from scipy.optimize import brentq
 
 from pycalceff.core.effic import (
+    DEFAULT_ROOT_FINDER,
+    DEFAULT_ROOT_FINDER_BISECT,
+    DEFAULT_ROOT_FINDER_BRENTH,
+    DEFAULT_ROOT_FINDER_BRENTQ,
+    DEFAULT_ROOT_FINDER_RIDDER,
+    DEFAULT_ROOT_FINDER_TOMS748,
     BoundDirection,
+    HPDAlgorithm,
+    _compute_hpd_interval_cached,
     beta_ab,
     beta_logpdf,
     beta_pdf,
+    compute_hpd_interval_general,
+    compute_hpd_interval_k_ntrials,
+    compute_hpd_interval_k_zero,
+    compute_hpd_interval_newton,
     effic,
+    effic_batch,
     posterior_density,
     probability_mass,
     search_bound,
@@ -32,6 +51,17 @@ def test_beta_ab() -> None:
     assert result == pytest.approx(expected, abs=1e-6)
 
 
+def test_beta_ab_boundary_intervals() -> None:
+    """Test that intervals touching 0 or 1 partition the total mass."""
+    for x in (0.1, 0.35, 0.9):
+        below = beta_ab(0.0, x, 3, 11)
+        above = beta_ab(x, 1.0, 3, 11)
+        assert below + above == pytest.approx(1.0, abs=1e-15)
+        assert beta_ab(0.05, x, 3, 11) == pytest.approx(
+            below - beta_ab(0.0, 0.05, 3, 11), abs=1e-15
+        )
+
+
 def test_search_bound_upper() -> None:
     """Test search_bound for upper bound."""
     # For k=10, N=20, low=0.4, c=0.8
@@ -112,6 +142,16 @@ def test_beta_pdf() -> None:
     assert result == pytest.approx(expected, abs=1e-10)
 
 
+def test_beta_pdf_endpoints() -> None:
+    """Test beta_logpdf and beta_pdf at and beyond the endpoints."""
+    assert beta_logpdf(0.0, 3, 10) == float("-inf")
+    assert beta_logpdf(1.0, 3, 10) == float("-inf")
+    assert beta_pdf(1.5, 3, 10) == 0.0
+    # The density of Beta(1, N+1) at 0 and of Beta(N+1, 1) at 1 is N+1
+    assert beta_pdf(0.0, 0, 10) == pytest.approx(11.0, rel=1e-12)
+    assert beta_pdf(1.0, 10, 10) == pytest.approx(11.0, rel=1e-12)
+
+
 def test_shortest_hpd_beta() -> None:
     """Test shortest_hpd_beta for correctness."""
     k, ntrials, C = 5, 10, 0.95
@@ -134,6 +174,110 @@ def test_shortest_hpd_beta() -> None:
     assert pdf_a == pytest.approx(pdf_b, rel=1e-3)
 
 
+@pytest.mark.parametrize(
+    ("k", "ntrials", "conflevel"),
+    [
+        (5, 10, 0.95),
+        (1, 2, 0.5),
+        (3, 100, 0.9),
+        (99, 100, 0.999),
+        (2, 5, 1e-3),
+    ],
+)
+def test_compute_hpd_interval_newton(
+    k: int, ntrials: int, conflevel: float
+) -> None:
+    """Test that the Newton HPD interval matches shortest_hpd_beta."""
+    low, high = compute_hpd_interval_newton(k, ntrials, conflevel)
+    expected_low, expected_high = shortest_hpd_beta(k, ntrials, conflevel)
+    assert low == pytest.approx(expected_low, abs=1e-9)
+    assert high == pytest.approx(expected_high, abs=1e-9)
+
+
+def test_compute_hpd_interval_newton_fallback() -> None:
+    """Test that Newton falls back to the root-finding solver."""
+    calls = 0
+
+    def counting_brentq(f: Any, a: float, b: float, **kwargs: Any) -> float:
+        nonlocal calls
+        calls += 1
+        return float(brentq(f, a, b, **kwargs))
+
+    low, high = compute_hpd_interval_newton(
+        5, 10, 0.95, counting_brentq, maxiter=0
+    )
+    assert calls > 0
+    assert (low, high) == compute_hpd_interval_general(5, 10, 0.95, brentq)
+
+
+@pytest.mark.parametrize(
+    "root_finder",
+    [
+        DEFAULT_ROOT_FINDER_BISECT,
+        DEFAULT_ROOT_FINDER_BRENTH,
+        DEFAULT_ROOT_FINDER_BRENTQ,
+        DEFAULT_ROOT_FINDER_RIDDER,
+        DEFAULT_ROOT_FINDER_TOMS748,
+    ],
+)
+@pytest.mark.parametrize(
+    ("k", "ntrials", "conflevel"),
+    [
+        (77262243, 128718297, 1e-6),
+        (20268187, 84959320, 1.5e-8),
+        (3 * 10**8, 10**9, 1e-12),
+    ],
+)
+def test_compute_hpd_interval_general_narrow(
+    k: int, ntrials: int, conflevel: float, root_finder: Any
+) -> None:
+    """Test intervals around 1e-10 wide or narrower, from a small conflevel
+    and a large ntrials. The posterior is then close to normal, so the
+    interval is centred on the mode."""
+    low, high = compute_hpd_interval_general(
+        k, ntrials, conflevel, root_finder
+    )
+    mode = k / ntrials
+    assert low <= mode <= high
+    assert high - low < 1e-9
+    assert (low + high) / 2 == pytest.approx(mode, abs=1e-12)
+
+    # Newton's fallback and effic's ROOT_FINDING use the same solver.
+    fallback = compute_hpd_interval_newton(
+        k, ntrials, conflevel, root_finder, maxiter=0
+    )
+    assert fallback == (low, high)
+    _, effic_low, effic_high = effic(
+        k,
+        ntrials,
+        conflevel,
+        root_finder=root_finder,
+        algorithm=HPDAlgorithm.ROOT_FINDING,
+    )
+    assert (effic_low, effic_high) == (low, high)
+
+
+@pytest.mark.parametrize("ntrials", [1, 10, 1000, 10**6])
+@pytest.mark.parametrize("conflevel", [1e-3, 0.68, 0.9, 0.999])
+def test_compute_hpd_interval_closed_forms(
+    ntrials: int, conflevel: float
+) -> None:
+    """Test the k=0 and k=N intervals against the analytic quantiles.
+
+    The posteriors are Beta(1, N+1), with CDF 1 - (1-x)^(N+1), and
+    Beta(N+1, 1), with CDF x^(N+1).
+    """
+    log_tail = math.log1p(-conflevel) / (ntrials + 1)
+
+    low, high = compute_hpd_interval_k_zero(ntrials, conflevel)
+    assert low == 0.0
+    assert high == pytest.approx(-math.expm1(log_tail), rel=1e-12)
+
+    low, high = compute_hpd_interval_k_ntrials(ntrials, conflevel)
+    assert high == 1.0
+    assert low == pytest.approx(math.exp(log_tail), rel=1e-12)
+
+
 def test_effic_known_values() -> None:
     """Test effic with known values."""
     # Test edge cases
@@ -162,6 +306,91 @@ def test_effic_invalid_conflevel() -> None:
         effic(5, 10, 1.0)
 
 
+def test_effic_memoized() -> None:
+    """Test that repeated effic calls are served from the cache."""
+    _compute_hpd_interval_cached.cache_clear()
+    first = effic(7, 13, 0.68)
+    second = effic(7, 13, 0.68)
+    assert first == second
+    assert _compute_hpd_interval_cached.cache_info().hits == 1
+
+
+@pytest.mark.parametrize("hashable", [True, False])
+def test_effic_custom_root_finder_not_cached(hashable: bool) -> None:
+    """Test that root finders other than the module's own bypass the cache."""
+
+    class CustomRootFinder:
+        if not hashable:
+            __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, *args: Any, **kwargs: Any) -> float:
+            return float(DEFAULT_ROOT_FINDER(*args, **kwargs))
+
+    expected = effic(5, 10, 0.9, algorithm=HPDAlgorithm.ROOT_FINDING)
+    cache_size = _compute_hpd_interval_cached.cache_info().currsize
+    for _ in range(3):
+        result = effic(
+            5,
+            10,
+            0.9,
+            root_finder=CustomRootFinder(),
+            algorithm=HPDAlgorithm.ROOT_FINDING,
+        )
+        assert result == expected
+    assert _compute_hpd_interval_cached.cache_info().currsize == cache_size
+
+
+def test_default_root_finders() -> None:
+    """Test that the root finders compare, hash and pickle by name."""
+    from scipy.optimize import brentq
+
+    def f(x: float) -> float:
+        return x * x - 0.5
+
+    assert DEFAULT_ROOT_FINDER_BRENTQ(f, 0.0, 1.0) == brentq(f, 0.0, 1.0)
+    assert DEFAULT_ROOT_FINDER_TOMS748(f, 0.0, 1.0) == pytest.approx(0.5**0.5)
+    assert DEFAULT_ROOT_FINDER_BRENTQ != DEFAULT_ROOT_FINDER_TOMS748
+    for root_finder in (
+        DEFAULT_ROOT_FINDER_BRENTQ,
+        DEFAULT_ROOT_FINDER_TOMS748,
+    ):
+        copy = pickle.loads(pickle.dumps(root_finder))
+        assert copy == root_finder
+        assert hash(copy) == hash(root_finder)
+
+
+def test_effic_batch_matches_effic() -> None:
+    """Test that effic_batch agrees with effic pair by pair."""
+    pairs = [(0, 10), (10, 10), (8, 10), (1, 2), (5, 15), (10, 20), (0, 1)]
+    ks = [k for k, _ in pairs]
+    ns = [n for _, n in pairs]
+
+    modes, lows, highs = effic_batch(ks, ns, 0.8)
+
+    assert modes.shape == lows.shape == highs.shape == (len(pairs),)
+    for (k, n), mode, low, high in zip(pairs, modes, lows, highs, strict=True):
+        expected_mode, expected_low, expected_high = effic(k, n, 0.8)
+        assert mode == expected_mode
+        assert low == pytest.approx(expected_low, abs=1e-10)
+        assert high == pytest.approx(expected_high, abs=1e-10)
+
+
+def test_effic_batch_scalar_input() -> None:
+    """Test that effic_batch preserves the shape of scalar input."""
+    mode, low, high = effic_batch(8, 10, 0.8)
+    assert mode.shape == low.shape == high.shape == ()
+    assert 0 <= low <= mode <= high <= 1
+
+
+def test_effic_batch_invalid_conflevel() -> None:
+    """Test effic_batch with invalid confidence level."""
+    with pytest.raises(ValueError):
+        effic_batch([5], [10], 0.0)
+
+    with pytest.raises(ValueError):
+        effic_batch([5], [10], 1.0)
+
+
 def test_posterior_density() -> None:
     """Test posterior_density function with known values."""
     # Test Beta(1,2) for k=0, N=1
@@ -197,6 +426,19 @@ def test_posterior_density() -> None:
     assert posterior_density(1.1, 1, 2) == 0.0
 
 
+@pytest.mark.parametrize(("k", "n"), [(0, 1), (1, 2), (3, 3), (7, 20)])
+def test_posterior_density_array(k: int, n: int) -> None:
+    """Test that array input matches the scalar density elementwise."""
+    x = np.array([-0.1, 0.0, 1e-9, 0.25, 0.5, 0.75, 1.0 - 1e-9, 1.0, 1.1])
+    densities = posterior_density(x, k, n)
+    assert isinstance(densities, np.ndarray)
+    assert densities.shape == x.shape
+    assert densities.tolist() == pytest.approx(
+        [posterior_density(float(xi), k, n) for xi in x], rel=1e-12
+    )
+    assert posterior_density(x.reshape(3, 3), k, n).shape == (3, 3)
+
+
 def test_probability_mass() -> None:
     """Test probability_mass function with edge cases."""
     # Full interval [0, 1] should always be 1
@@ -235,3 +477,14 @@ def test_probability_mass() -> None:
     result = probability_mass(1, 2, 0.4, 0.6)
     expected = stats.beta.cdf(0.6, 2, 2) - stats.beta.cdf(0.4, 2, 2)
     assert result == pytest.approx(expected, abs=1e-10)
+
+
+def test_probability_mass_bounds_outside_support() -> None:
+    """Test that bounds outside [0, 1] are clamped to the support."""
+    assert probability_mass(3, 10, -0.1, 0.5) == pytest.approx(
+        stats.beta.cdf(0.5, 4, 8), abs=1e-12
+    )
+    assert probability_mass(3, 10, 0.5, 1.5) == pytest.approx(
+        stats.beta.sf(0.5, 4, 8), abs=1e-12
+    )
+    assert probability_mass(3, 10, -1.0, 2.0) == 1.0
@@ -6,7 +6,7 @@ Tests that the returned intervals are the shortest possible (HPD intervals).
 
 import pytest
 from conftest import k_n_pair_strategy
-from hypothesis import given
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from pycalceff.core.cli_utils import calculate_efficiencies
@@ -14,8 +14,8 @@ from pycalceff.core.effic import (
     BoundDirection,
     HPDAlgorithm,
     beta_ab,
+    beta_logpdf,
     effic,
-    posterior_density,
     search_bound,
 )
 
@@ -25,11 +25,29 @@ from pycalceff.core.effic import (
 SMALL_CONFLEVEL = 1e-3
 LARGE_CONFLEVEL = 1.0 - SMALL_CONFLEVEL
 
+# Tests that run full HPD solves per example use half the examples of the
+# active hypothesis profile. An explicit max_examples would override the
+# profile, so the cap is derived from it instead.
+SOLVER_MAX_EXAMPLES = max(1, settings.default.max_examples // 2)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_up() -> None:
+    """Run every algorithm once before the first example.
+
+    The root finders import scipy.optimize on first use, which would
+    otherwise count against the deadline of whichever example comes first.
+    """
+    for algorithm in HPDAlgorithm:
+        effic(1, 2, 0.5, algorithm=algorithm)
+
 
 @pytest.mark.parametrize(
     "algorithm",
     [HPDAlgorithm.ROOT_FINDING, HPDAlgorithm.BINARY_SEARCH],
 )
+# Each example solves for the interval and then for two shifted intervals.
+@settings(max_examples=SOLVER_MAX_EXAMPLES, deadline=None)
 @given(k_n_pair_strategy(), st.floats(SMALL_CONFLEVEL, LARGE_CONFLEVEL))
 def test_shortest_interval_property(
     algorithm: HPDAlgorithm, k_n_pair: tuple[int, int], conflevel: float
@@ -148,6 +166,7 @@ def test_search_bound_lower_properties(
     "algorithm",
     [HPDAlgorithm.ROOT_FINDING, HPDAlgorithm.BINARY_SEARCH],
 )
+@settings(max_examples=SOLVER_MAX_EXAMPLES, deadline=None)
 @given(k_n_pair_strategy(), st.floats(SMALL_CONFLEVEL, LARGE_CONFLEVEL))
 def test_effic_properties(
     algorithm: HPDAlgorithm, k_n_pair: tuple[int, int], conflevel: float
@@ -183,10 +202,14 @@ def test_hpd_interval_properties(
     k, N = k_n_pair
     _, low, high = effic(k, N, conflevel, algorithm=algorithm)
 
-    # For k > 0 and k < N, posterior density should be equal at endpoints
+    # For k > 0 and k < N, posterior density should be equal at endpoints.
+    # Compare log densities, which stay well scaled where the densities
+    # themselves are tiny.
     if 0 < k < N:
-        assert posterior_density(low, k, N) == pytest.approx(
-            posterior_density(high, k, N), rel=1e-6
+        log_density_low = beta_logpdf(low, k, N)
+        log_density_high = beta_logpdf(high, k, N)
+        assert log_density_low - log_density_high == pytest.approx(
+            0.0, abs=1e-6
         )
 
     # The integral over the interval should equal the confidence level
@@ -194,11 +217,13 @@ def test_hpd_interval_properties(
     assert integral == pytest.approx(conflevel, abs=1e-9)
 
 
+# Each example runs three full HPD solves, so cap the example count.
+@settings(max_examples=SOLVER_MAX_EXAMPLES, deadline=None)
 @given(k_n_pair_strategy(), st.floats(0.1, LARGE_CONFLEVEL))
 def test_hpd_algorithms_equivalence(
     k_n_pair: tuple[int, int], conflevel: float
 ) -> None:
-    """Test that both HPD algorithms produce equivalent results."""
+    """Test that the HPD algorithms produce equivalent results."""
     k, N = k_n_pair
 
     # Compute with both algorithms
@@ -209,6 +234,11 @@ def test_hpd_algorithms_equivalence(
         k, N, conflevel, algorithm=HPDAlgorithm.BINARY_SEARCH
     )
 
+    # The Newton iteration on the equal-height condition agrees as well
+    _, low3, high3 = effic(k, N, conflevel, algorithm=HPDAlgorithm.NEWTON)
+    assert low3 == pytest.approx(low2, abs=1e-9)
+    assert high3 == pytest.approx(high2, abs=1e-9)
+
     # Modes should be identical (same posterior)
     assert mode1 == pytest.approx(mode2, abs=1e-12)
 